@@ -26,8 +26,20 @@ export function NetworkBlockIndicator({ className }: NetworkBlockIndicatorProps)
 
   const network = networkId ? getNetwork(networkId) : undefined;
 
+  // One client per network, reused by every poll instead of rebuilt each tick. It also
+  // keeps the client's last working endpoint between polls
+  const client = useMemo(() => {
+    if (!networkId) return null;
+    try {
+      return new RPCClient(getRPCUrls(networkId, rpcUrls));
+    } catch (error) {
+      console.error("Failed to create RPC client:", error);
+      return null;
+    }
+  }, [networkId, rpcUrls]);
+
   useEffect(() => {
-    if (!networkId) {
+    if (!client) {
       setBlockNumber(null);
       return;
     }
@@ -37,8 +49,6 @@ export function NetworkBlockIndicator({ className }: NetworkBlockIndicatorProps)
 
     const fetchBlockNumber = async () => {
       try {
-        const urls = getRPCUrls(networkId, rpcUrls);
-        const client = new RPCClient(urls);
         const result = await client.call<string>("eth_blockNumber", []);
         if (isMounted) {
           setBlockNumber(parseInt(result, 16));
@@ -64,7 +74,7 @@ export function NetworkBlockIndicator({ className }: NetworkBlockIndicatorProps)
         clearInterval(intervalId);
       }
     };
-  }, [networkId, rpcUrls]);
+  }, [client]);
 
   if (!networkId || !network) return null;
 
@@ -92,29 +92,31 @@ const ERC1155Display: React.FC<ERC1155DisplayProps> = ({
         { selector: "0x95d89b41", key: "symbol" }, // symbol()
       ];
 
-      for (const call of calls) {
-        try {
-          const response = await fetch(rpcUrl, {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({
-              jsonrpc: "2.0",
-              method: "eth_call",
-              params: [{ to: addressHash, data: call.selector }, "latest"],
-              id: 1,
-            }),
-          });
-          const data = await response.json();
-          if (!data.error && data.result && data.result !== "0x") {
-            const decoded = decodeAbiString(data.result);
-            if (decoded) {
-              results[call.key as "name" | "symbol"] = decoded;
+      await Promise.all(
+        calls.map(async (call) => {
+          try {
+            const response = await fetch(rpcUrl, {
+              method: "POST",
+              headers: { "Content-Type": "application/json" },
+              body: JSON.stringify({
+                jsonrpc: "2.0",
+                method: "eth_call",
+                params: [{ to: addressHash, data: call.selector }, "latest"],
+                id: 1,
+              }),
+            });
+            const data = await response.json();
+            if (!data.error && data.result && data.result !== "0x") {
+              const decoded = decodeAbiString(data.result);
+              if (decoded) {
+                results[call.key as "name" | "symbol"] = decoded;
+              }
             }
+          } catch {
+            // Continue
           }
-        } catch {
-          // Continue
-        }
-      }
+        }),
+      );
 
       // Try to get URI for token ID 0 as a sample
       // uri(uint256) with tokenId = 0
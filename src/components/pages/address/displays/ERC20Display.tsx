@@ -12,6 +12,7 @@ import type {
   RPCMetadata,
   Transaction,
 } from "../../../../types";
+import { decodeAbiString } from "../../../../utils/hexUtils";
 import { AddressHeader, ContractDetails, TransactionHistory } from "../shared";
 import ENSRecordsDetails from "../shared/ENSRecordsDisplay";
 
@@ -91,53 +92,37 @@ const ERC20Display: React.FC<ERC20DisplayProps> = ({
 
       const results: Record<string, string> = {};
 
-      for (const call of calls) {
-        try {
-          const response = await fetch(rpcUrl, {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({
-              jsonrpc: "2.0",
-              method: "eth_call",
-              params: [{ to: addressHash, data: call.selector }, "latest"],
-              id: 1,
-            }),
-          });
-          const data = await response.json();
-          if (!data.error && data.result && data.result !== "0x") {
-            results[call.key] = data.result;
+      await Promise.all(
+        calls.map(async (call) => {
+          try {
+            const response = await fetch(rpcUrl, {
+              method: "POST",
+              headers: { "Content-Type": "application/json" },
+              body: JSON.stringify({
+                jsonrpc: "2.0",
+                method: "eth_call",
+                params: [{ to: addressHash, data: call.selector }, "latest"],
+                id: 1,
+              }),
+            });
+            const data = await response.json();
+            if (!data.error && data.result && data.result !== "0x") {
+              results[call.key] = data.result;
+            }
+          } catch {
+            // Continue
           }
-        } catch {
-          // Continue
-        }
-      }
+        }),
+      );
 
       // Decode results
       const decoded: typeof onChainData = {};
 
-      // Decode string (name, symbol)
-      const decodeString = (hex: string): string => {
-        try {
-          // Remove 0x prefix
-          const data = hex.slice(2);
-          // Check if it's dynamic string (offset + length + data)
-          if (data.length >= 128) {
-            const lengthHex = data.slice(64, 128);
-            const length = parseInt(lengthHex, 16);
-            const strHex = data.slice(128, 128 + length * 2);
-            return Buffer.from(strHex, "hex").toString("utf8");
-          }
-          return "";
-        } catch {
-          return "";
-        }
-      };
-
       if (results.name) {
-        decoded.name = decodeString(results.name);
+        decoded.name = decodeAbiString(results.name);
       }
       if (results.symbol) {
-        decoded.symbol = decodeString(results.symbol);
+        decoded.symbol = decodeAbiString(results.symbol);
       }
       if (results.decimals) {
         decoded.decimals = parseInt(results.decimals, 16);
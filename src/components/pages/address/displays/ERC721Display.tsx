@@ -92,26 +92,28 @@ const ERC721Display: React.FC<ERC721DisplayProps> = ({
 
       const results: Record<string, string> = {};
 
-      for (const call of calls) {
-        try {
-          const response = await fetch(rpcUrl, {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({
-              jsonrpc: "2.0",
-              method: "eth_call",
-              params: [{ to: addressHash, data: call.selector }, "latest"],
-              id: 1,
-            }),
-          });
-          const data = await response.json();
-          if (!data.error && data.result && data.result !== "0x") {
-            results[call.key] = data.result;
+      await Promise.all(
+        calls.map(async (call) => {
+          try {
+            const response = await fetch(rpcUrl, {
+              method: "POST",
+              headers: { "Content-Type": "application/json" },
+              body: JSON.stringify({
+                jsonrpc: "2.0",
+                method: "eth_call",
+                params: [{ to: addressHash, data: call.selector }, "latest"],
+                id: 1,
+              }),
+            });
+            const data = await response.json();
+            if (!data.error && data.result && data.result !== "0x") {
+              results[call.key] = data.result;
+            }
+          } catch {
+            // Continue
           }
-        } catch {
-          // Continue
-        }
-      }
+        }),
+      );
 
       // Decode results
       const decoded: typeof onChainData = {};
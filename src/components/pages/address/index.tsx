@@ -7,7 +7,6 @@ import type {
   Address as AddressData,
   AddressTransactionsResult,
   AddressType,
-  DataWithMetadata,
   Transaction,
 } from "../../../types";
 import { fetchAddressWithType } from "../../../utils/addressTypeDetection";
@@ -107,19 +106,11 @@ export default function Address() {
         if (result.transactions.length > 0) {
           setLoadingTxDetails(true);
           const txsToFetch = result.transactions.slice(0, 25);
-          const txResults = await Promise.all(
-            txsToFetch.map((hash) =>
-              dataService.getTransaction(hash).catch((err) => {
-                console.error(`Failed to fetch tx ${hash}:`, err);
-                return null;
-              }),
-            ),
-          );
-          setTransactionDetails(
-            txResults
-              .filter((result): result is DataWithMetadata<Transaction> => result !== null)
-              .map((result) => result.data),
-          );
+          const txDetails = await dataService.getTransactions(txsToFetch).catch((err) => {
+            console.error("Failed to fetch transaction details:", err);
+            return [] as Transaction[];
+          });
+          setTransactionDetails(txDetails);
           setLoadingTxDetails(false);
         }
       })
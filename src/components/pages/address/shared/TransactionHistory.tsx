@@ -3,6 +3,7 @@ import { useCallback, useMemo } from "react";
 import { Link } from "react-router-dom";
 import { toFunctionSelector } from "viem";
 import type { ABI, AddressTransactionsResult, FunctionABI, Transaction } from "../../../../types";
+import { formatWeiToEth } from "../../../../utils/formatUtils";
 
 interface TransactionHistoryProps {
   networkId: string;
@@ -29,8 +30,7 @@ const TransactionHistory: React.FC<TransactionHistoryProps> = ({
 
   const formatValue = useCallback((value: string) => {
     try {
-      const eth = Number(value) / 1e18;
-      return `${eth.toFixed(6)} ETH`;
+      return `${formatWeiToEth(value)} ETH`;
     } catch {
       return "0 ETH";
     }
@@ -67,6 +67,7 @@ const TransactionHistory: React.FC<TransactionHistoryProps> = ({
   );
 
   const hasContractAbi = useMemo(() => contractAbi && contractAbi.length > 0, [contractAbi]);
+  const normalizedAddress = addressHash.toLowerCase();
 
   return (
     <div className="tx-details">
@@ -137,7 +138,7 @@ const TransactionHistory: React.FC<TransactionHistoryProps> = ({
                   </td>
                   {hasContractAbi && (
                     <td>
-                      {tx.to?.toLowerCase() === addressHash.toLowerCase() ? (
+                      {tx.to?.toLowerCase() === normalizedAddress ? (
                         (() => {
                           const funcName = decodeFunctionName(tx.data);
                           const selector = tx.data?.slice(0, 10);
@@ -165,7 +166,7 @@ const TransactionHistory: React.FC<TransactionHistoryProps> = ({
                   )}
                   <td>
                     <Link to={`/${networkId}/address/${tx.from}`} className="address-table-link">
-                      {tx.from?.toLowerCase() === addressHash.toLowerCase()
+                      {tx.from?.toLowerCase() === normalizedAddress
                         ? "This Address"
                         : truncate(tx.from || "", 6, 4)}
                     </Link>
@@ -174,9 +175,9 @@ const TransactionHistory: React.FC<TransactionHistoryProps> = ({
                     {tx.to ? (
                       <Link
                         to={`/${networkId}/address/${tx.to}`}
-                        className={`tx-table-to-link ${tx.to?.toLowerCase() === addressHash.toLowerCase() ? "tx-table-to-link-self" : "tx-table-to-link-other"}`}
+                        className={`tx-table-to-link ${tx.to?.toLowerCase() === normalizedAddress ? "tx-table-to-link-self" : "tx-table-to-link-other"}`}
                       >
-                        {tx.to?.toLowerCase() === addressHash.toLowerCase()
+                        {tx.to?.toLowerCase() === normalizedAddress
                           ? "This Address"
                           : truncate(tx.to, 6, 4)}
                       </Link>
@@ -45,14 +45,19 @@ export default function Blocks() {
           (_, i) => startBlock - i,
         ).filter((num) => num >= 0);
 
-        // Fetch blocks in parallel
-        const blockResults = await Promise.all(
-          blockNumbers.map((num) => dataService.getBlock(num)),
-        );
-
-        console.log("Fetched blocks:", blockResults);
-        // Extract data from results
-        setBlocks(blockResults.map((result) => result.data));
+        // Fetch all blocks of the page in a single batch request
+        const fetchedBlocks = await dataService.getBlocks(blockNumbers);
+
+        setBlocks(fetchedBlocks);
+
+        // Warm the cache with the next older page in the background, so paging back
+        // is served from memory. Failures are ignored, the page fetches on its own
+        const olderBlockNumbers = blockNumbers
+          .map((num) => num - BLOCKS_PER_PAGE)
+          .filter((num) => num >= 0);
+        if (olderBlockNumbers.length > 0) {
+          dataService.getBlocks(olderBlockNumbers).catch(() => {});
+        }
         // biome-ignore lint/suspicious/noExplicitAny: <TODO>
       } catch (err: any) {
         console.error("Error fetching blocks:", err);
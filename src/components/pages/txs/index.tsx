@@ -2,6 +2,7 @@ import { useEffect, useState } from "react";
 import { Link, useNavigate, useParams, useSearchParams } from "react-router-dom";
 import { useDataService } from "../../../hooks/useDataService";
 import type { Transaction } from "../../../types";
+import { formatWeiToEth } from "../../../utils/formatUtils";
 import Loader from "../../common/Loader";
 
 const BLOCKS_PER_PAGE = 10;
@@ -55,7 +56,6 @@ export default function Txs() {
           BLOCKS_PER_PAGE,
         );
 
-        console.log("Fetched transactions:", fetchedTransactions);
         setTransactions(fetchedTransactions);
         // biome-ignore lint/suspicious/noExplicitAny: <TODO>
       } catch (err: any) {
@@ -77,8 +77,7 @@ export default function Txs() {
 
   const formatValue = (value: string) => {
     try {
-      const eth = Number(value) / 1e18;
-      return `${eth.toFixed(6)} ETH`;
+      return `${formatWeiToEth(value)} ETH`;
     } catch (_e) {
       return value;
     }
@@ -16,6 +16,8 @@ export type { NetworkConfig };
 // Cache for loaded networks
 let loadedNetworks: NetworkConfig[] | null = null;
 let networksUpdatedAt: string | null = null;
+// Lookup table over loadedNetworks, built once per load since lookups by ID run on every render
+let networksById = new Map<number, NetworkConfig>();
 
 /**
  * Convert metadata network to NetworkConfig
@@ -50,6 +52,7 @@ export async function loadNetworks(): Promise<NetworkConfig[]> {
 
   const response: NetworksResponse = await fetchNetworks();
   loadedNetworks = response.networks.map(metadataToNetworkConfig);
+  networksById = new Map(loadedNetworks.map((network) => [network.networkId, network]));
   networksUpdatedAt = response.updatedAt;
   console.log(
     `Loaded ${loadedNetworks.length} networks from metadata (updated: ${networksUpdatedAt})`,
@@ -118,7 +121,7 @@ export function isNetworkEnabled(networkId: number): boolean {
  * Get network config by network ID
  */
 export function getNetworkById(networkId: number): NetworkConfig | undefined {
-  return getAllNetworks().find((n) => n.networkId === networkId);
+  return networksById.get(networkId);
 }
 
 /**
@@ -142,6 +145,7 @@ export function getNetworksUpdatedAt(): string | null {
  */
 export async function reloadNetworks(): Promise<NetworkConfig[]> {
   loadedNetworks = null;
+  networksById = new Map();
   networksUpdatedAt = null;
   return loadNetworks();
 }
@@ -14,3 +14,33 @@ export function getRPCUrls(networkId: number, rpcUrlsMap: RpcUrlsContextType): s
   }
   return urls;
 }
+
+// Origins that already have a preconnect hint in the document head
+const preconnectedOrigins = new Set<string>();
+
+/**
+ * Add <link rel="preconnect"> hints for RPC endpoints so the DNS/TCP/TLS setup happens
+ * at startup instead of delaying the first JSON-RPC request. Only https origins are
+ * hinted, plain http endpoints are local nodes with nothing to warm up
+ * @param urls - RPC URLs to warm up, duplicate origins are only hinted once
+ */
+export function preconnectRPCUrls(urls: string[]): void {
+  if (typeof document === "undefined") return;
+
+  for (const url of urls) {
+    let origin: string;
+    try {
+      origin = new URL(url).origin;
+    } catch {
+      continue;
+    }
+    if (!origin.startsWith("https:") || preconnectedOrigins.has(origin)) continue;
+    preconnectedOrigins.add(origin);
+
+    const link = document.createElement("link");
+    link.rel = "preconnect";
+    link.href = origin;
+    link.crossOrigin = "anonymous";
+    document.head.appendChild(link);
+  }
+}
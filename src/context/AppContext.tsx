@@ -1,6 +1,7 @@
 import { createContext, type ReactNode, useContext, useEffect, useMemo, useState } from "react";
 import { useAccount } from "wagmi";
 import { getAllNetworks, getNetworkById, loadNetworks } from "../config/networks";
+import { preconnectRPCUrls } from "../config/rpcConfig";
 import { useWagmiConnection } from "../hooks/useWagmiConnection";
 import type { IAppContext, NetworkConfig, RpcUrlsContextType } from "../types";
 import { loadJsonFilesFromStorage, saveJsonFilesToStorage } from "../utils/artifactsStorage";
@@ -122,6 +123,16 @@ export const AppContextProvider = ({ children }: { children: ReactNode }) => {
     loadNetworkData();
   }, []);
 
+  // Warm up the connection to the primary RPC endpoint of the network in the current route,
+  // the one the fallback strategy tries first, while the rest of the app is still loading.
+  // Routes start with the network ID, after the GitHub Pages basename or hash if any
+  useEffect(() => {
+    const { hash, pathname } = window.location;
+    const networkSegment = (hash || pathname).split("/").find((segment) => /^\d+$/.test(segment));
+    const url = networkSegment ? rpcUrls[Number(networkSegment)]?.[0] : undefined;
+    if (url) preconnectRPCUrls([url]);
+  }, [rpcUrls]);
+
   useEffect(() => {
     const checkResourcesLoaded = () => {
       // Check if all critical resources are loaded
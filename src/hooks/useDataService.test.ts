@@ -0,0 +1,43 @@
+import { renderHook } from "@testing-library/react";
+import { describe, expect, it, vi } from "vitest";
+import { useDataService } from "./useDataService";
+
+const settings = vi.hoisted(() => ({ rpcStrategy: "fallback" as "fallback" | "parallel" }));
+
+vi.mock("../context/SettingsContext", () => ({
+  useSettings: () => ({ settings }),
+}));
+
+vi.mock("../context/AppContext", async () => {
+  const { createContext } = await import("react");
+  return {
+    AppContext: createContext({
+      rpcUrls: { 1: ["https://eth.rpc.test"], 10: ["https://op.rpc.test"] },
+    }),
+  };
+});
+
+describe("useDataService", () => {
+  it("should share one instance between consumers of the same network", () => {
+    const first = renderHook(() => useDataService(1));
+    const second = renderHook(() => useDataService(1));
+
+    expect(second.result.current).toBe(first.result.current);
+  });
+
+  it("should drop the previous instance when the settings change", () => {
+    settings.rpcStrategy = "fallback";
+    const { result, rerender } = renderHook(() => useDataService(10));
+    const original = result.current;
+
+    settings.rpcStrategy = "parallel";
+    rerender();
+    expect(result.current).not.toBe(original);
+
+    // Switching back builds a new instance, the one created for these settings was dropped
+    settings.rpcStrategy = "fallback";
+    rerender();
+    expect(result.current).not.toBe(original);
+    expect(renderHook(() => useDataService(10)).result.current).toBe(result.current);
+  });
+});
@@ -4,6 +4,10 @@ import { AppContext } from "../context/AppContext";
 import { useSettings } from "../context/SettingsContext";
 import { DataService } from "../services/DataService";
 
+// DataService instances are shared between components, so the response cache and the
+// RPC client's last working endpoint survive page navigation instead of starting cold
+const dataServiceInstances = new Map<string, DataService>();
+
 /**
  * Hook to get a DataService for a specific network
  * Automatically applies the RPC strategy from user settings
@@ -14,23 +18,25 @@ export function useDataService(networkId: number) {
   const { rpcUrls } = useContext(AppContext);
   const { settings } = useSettings();
 
-  console.log(
-    "useDataService called with networkId:",
-    networkId,
-    "strategy:",
-    settings.rpcStrategy,
-  );
-
   const dataService = useMemo(() => {
-    console.log(
-      "useMemo creating new DataService for networkId:",
-      networkId,
-      "with strategy:",
-      settings.rpcStrategy,
-    );
-    return new DataService(networkId, rpcUrls, settings.rpcStrategy);
+    const urls = rpcUrls[networkId] ?? [];
+    const key = `${networkId}:${settings.rpcStrategy}:${urls.join(",")}`;
+    let instance = dataServiceInstances.get(key);
+    if (!instance) {
+      // The strategy or RPC URLs for this network changed, the old instance won't be used again
+      const staleKeys: string[] = [];
+      dataServiceInstances.forEach((_, existingKey) => {
+        if (existingKey.startsWith(`${networkId}:`)) staleKeys.push(existingKey);
+      });
+      staleKeys.forEach((staleKey) => {
+        dataServiceInstances.delete(staleKey);
+      });
+
+      instance = new DataService(networkId, rpcUrls, settings.rpcStrategy);
+      dataServiceInstances.set(key, instance);
+    }
+    return instance;
   }, [networkId, rpcUrls, settings.rpcStrategy]);
 
-  console.log("useDataService returning dataService for networkId:", networkId);
   return dataService;
 }
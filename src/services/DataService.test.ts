@@ -0,0 +1,400 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from "vitest";
+import type { RPCBlock, RPCTransaction, RPCTransactionReceipt } from "../types";
+import { DataService } from "./DataService";
+
+// Chain served by the mocked RPCClient, reset before each test
+const node = vi.hoisted(() => ({
+  head: 0,
+  blocks: new Map<number, unknown>(),
+  transactions: new Map<string, unknown>(),
+  receipts: new Map<string, unknown>(),
+  strategy: "fallback" as "fallback" | "parallel",
+  rejectBatches: false,
+  requests: [] as string[],
+}));
+
+vi.mock("./EVM/common/RPCClient", () => {
+  // biome-ignore lint/suspicious/noExplicitAny: <TODO>
+  const respond = (method: string, params: any[]): unknown => {
+    node.requests.push(method);
+    switch (method) {
+      case "eth_blockNumber":
+        return `0x${node.head.toString(16)}`;
+      case "eth_getBlockByNumber":
+        return node.blocks.get(parseInt(params[0], 16)) ?? null;
+      case "eth_getTransactionByHash":
+        return node.transactions.get(params[0]) ?? null;
+      case "eth_getTransactionReceipt":
+        return node.receipts.get(params[0]) ?? null;
+      default:
+        throw new Error(`Unexpected RPC method ${method}`);
+    }
+  };
+
+  return {
+    RPCClient: class {
+      getStrategy() {
+        return node.strategy;
+      }
+
+      // Two providers that agree on every response
+      // biome-ignore lint/suspicious/noExplicitAny: <TODO>
+      async parallelCall(method: string, params: any[] = []) {
+        const response = respond(method, params);
+        return ["https://a.rpc.test", "https://b.rpc.test"].map((url) => ({
+          url,
+          status: "fulfilled",
+          response,
+        }));
+      }
+
+      // biome-ignore lint/suspicious/noExplicitAny: <TODO>
+      async call(method: string, params: any[] = []) {
+        return respond(method, params);
+      }
+
+      // biome-ignore lint/suspicious/noExplicitAny: <TODO>
+      async batchCall(calls: Array<{ method: string; params: any[] }>) {
+        if (node.rejectBatches) {
+          throw new Error("RPC batch request rejected: batch requests are not supported");
+        }
+        return calls.map((call) => respond(call.method, call.params));
+      }
+    },
+  };
+});
+
+function toHex(value: number): string {
+  return `0x${value.toString(16)}`;
+}
+
+function addBlock(blockNumber: number, transactions: string[] = []): void {
+  const block: RPCBlock = {
+    number: toHex(blockNumber),
+    hash: `0xb${blockNumber}`,
+    parentHash: `0xb${blockNumber - 1}`,
+    nonce: "0x0",
+    sha3Uncles: "0x",
+    logsBloom: "0x",
+    transactionsRoot: "0x",
+    stateRoot: "0x",
+    receiptsRoot: "0x",
+    miner: "0x0000000000000000000000000000000000000000",
+    difficulty: "0x0",
+    totalDifficulty: "0x0",
+    extraData: "0x",
+    size: "0x0",
+    gasLimit: "0x1c9c380",
+    gasUsed: "0x0",
+    timestamp: toHex(1700000000 + blockNumber),
+    transactions,
+    uncles: [],
+    baseFeePerGas: "0x3b9aca00",
+    mixHash: "0x",
+    blobGasUsed: "0x0",
+    excessBlobGas: "0x0",
+    withdrawalsRoot: "0x",
+    withdrawals: [],
+  };
+  node.blocks.set(blockNumber, block);
+}
+
+function addTransaction(hash: string, blockNumber: number): void {
+  const transaction: RPCTransaction = {
+    blockHash: `0xb${blockNumber}`,
+    blockNumber: toHex(blockNumber),
+    from: "0x1111111111111111111111111111111111111111",
+    gas: "0x5208",
+    gasPrice: "0x3b9aca00",
+    hash,
+    input: "0x",
+    nonce: "0x0",
+    to: "0x2222222222222222222222222222222222222222",
+    transactionIndex: "0x0",
+    value: "0xde0b6b3a7640000",
+    type: "0x0",
+    chainId: "0x1",
+    v: "0x1b",
+    r: "0x1",
+    s: "0x1",
+  };
+  const receipt: RPCTransactionReceipt = {
+    transactionHash: hash,
+    transactionIndex: "0x0",
+    blockHash: `0xb${blockNumber}`,
+    blockNumber: toHex(blockNumber),
+    from: transaction.from,
+    to: transaction.to,
+    cumulativeGasUsed: "0x5208",
+    gasUsed: "0x5208",
+    contractAddress: "",
+    logs: [],
+    logsBloom: "0x",
+    status: "0x1",
+    effectiveGasPrice: "0x3b9aca00",
+    type: "0x0",
+  };
+  node.transactions.set(hash, transaction);
+  node.receipts.set(hash, receipt);
+}
+
+function countRequests(method: string): number {
+  return node.requests.filter((request) => request === method).length;
+}
+
+function createDataService(networkId = 1): DataService {
+  return new DataService(networkId, { [networkId]: ["https://rpc.test"] });
+}
+
+describe("DataService", () => {
+  beforeEach(() => {
+    node.head = 100;
+    node.blocks.clear();
+    node.transactions.clear();
+    node.receipts.clear();
+    node.strategy = "fallback";
+    node.rejectBatches = false;
+    node.requests.length = 0;
+  });
+
+  describe("cache", () => {
+    beforeEach(() => {
+      vi.useFakeTimers();
+    });
+
+    afterEach(() => {
+      vi.useRealTimers();
+    });
+
+    it("should keep finalized blocks and expire recent ones", async () => {
+      addBlock(10);
+      addBlock(99);
+      const dataService = createDataService();
+      await dataService.getLatestBlockNumber();
+      await dataService.getBlock(10);
+      await dataService.getBlock(99);
+
+      vi.advanceTimersByTime(30001);
+      node.requests.length = 0;
+      await dataService.getBlock(10);
+      expect(node.requests).toEqual([]);
+      await dataService.getBlock(99);
+      expect(countRequests("eth_getBlockByNumber")).toBe(1);
+    });
+
+    it("should never treat local dev chain blocks as finalized", async () => {
+      addBlock(10);
+      const dataService = createDataService(31337);
+      await dataService.getLatestBlockNumber();
+      await dataService.getBlock(10);
+
+      vi.advanceTimersByTime(30001);
+      node.requests.length = 0;
+      await dataService.getBlock(10);
+      expect(countRequests("eth_getBlockByNumber")).toBe(1);
+    });
+
+    it("should evict the least recently used entry when full", async () => {
+      const blockNumbers = Array.from({ length: 1000 }, (_, i) => i);
+      for (const blockNumber of blockNumbers) addBlock(blockNumber);
+      addBlock(1000);
+      const dataService = createDataService();
+      await dataService.getBlocks(blockNumbers);
+
+      // Reading block 0 makes block 1 the least recently used entry
+      await dataService.getBlock(0);
+      await dataService.getBlock(1000);
+
+      node.requests.length = 0;
+      await dataService.getBlock(0);
+      expect(node.requests).toEqual([]);
+      await dataService.getBlock(1);
+      expect(countRequests("eth_getBlockByNumber")).toBe(1);
+    });
+
+    it("should return the provider comparison again when a page is revisited", async () => {
+      addBlock(10);
+      node.strategy = "parallel";
+      const dataService = createDataService();
+
+      const first = await dataService.getBlock(10);
+      node.requests.length = 0;
+      const second = await dataService.getBlock(10);
+
+      expect(node.requests).toEqual([]);
+      expect(second.metadata).toBeDefined();
+      expect(second.metadata).toEqual(first.metadata);
+    });
+
+    it("should refetch in parallel mode when the cached entry has no comparison", async () => {
+      addBlock(10);
+      node.strategy = "parallel";
+      const dataService = createDataService();
+
+      // Block lists are batched from a single provider
+      await dataService.getBlocks([10]);
+      node.requests.length = 0;
+      const { metadata } = await dataService.getBlock(10);
+
+      expect(metadata?.responses).toHaveLength(2);
+      expect(countRequests("eth_getBlockByNumber")).toBe(1);
+    });
+  });
+
+  describe("chain head", () => {
+    beforeEach(() => {
+      vi.useFakeTimers();
+    });
+
+    afterEach(() => {
+      vi.useRealTimers();
+    });
+
+    it("should keep cached blocks when a lagging endpoint reports a lower head", async () => {
+      addBlock(100);
+      const dataService = createDataService();
+      await dataService.getLatestBlockNumber();
+      await dataService.getBlock(100);
+
+      vi.advanceTimersByTime(5001);
+      node.head = 90;
+      expect(await dataService.getLatestBlockNumber()).toBe(90);
+
+      node.requests.length = 0;
+      await dataService.getBlock(100);
+      expect(node.requests).toEqual([]);
+    });
+
+    it("should drop cached blocks above the head when a local chain is reset", async () => {
+      addBlock(90);
+      addBlock(100);
+      const dataService = createDataService(31337);
+      await dataService.getLatestBlockNumber();
+      await dataService.getBlock(90);
+      await dataService.getBlock(100);
+
+      vi.advanceTimersByTime(5001);
+      node.head = 90;
+      expect(await dataService.getLatestBlockNumber()).toBe(90);
+
+      node.requests.length = 0;
+      await dataService.getBlock(90);
+      expect(node.requests).toEqual([]);
+      await dataService.getBlock(100);
+      expect(countRequests("eth_getBlockByNumber")).toBe(1);
+    });
+  });
+
+  describe("request coalescing", () => {
+    it("should share one request between concurrent lookups of the same block", async () => {
+      addBlock(5);
+      const dataService = createDataService();
+
+      const [first, second] = await Promise.all([dataService.getBlock(5), dataService.getBlock(5)]);
+
+      expect(second.data).toBe(first.data);
+      expect(countRequests("eth_getBlockByNumber")).toBe(1);
+    });
+
+    it("should share one request between concurrent lookups of the same transaction", async () => {
+      addBlock(5);
+      addTransaction("0xaa", 5);
+      const dataService = createDataService();
+
+      await Promise.all([dataService.getTransaction("0xaa"), dataService.getTransaction("0xaa")]);
+
+      expect(countRequests("eth_getTransactionByHash")).toBe(1);
+      expect(countRequests("eth_getTransactionReceipt")).toBe(1);
+    });
+
+    it("should not keep a failed request for later lookups", async () => {
+      const dataService = createDataService();
+      await expect(dataService.getBlock(7)).rejects.toThrow("Block not found");
+
+      addBlock(7);
+      const { data } = await dataService.getBlock(7);
+      expect(Number(data.number)).toBe(7);
+    });
+  });
+
+  describe("getBlocks", () => {
+    it("should skip blocks that are not found", async () => {
+      addBlock(1);
+      addBlock(3);
+      const dataService = createDataService();
+
+      const blocks = await dataService.getBlocks([3, 2, 1]);
+
+      expect(blocks.map((block) => Number(block.number))).toEqual([3, 1]);
+    });
+
+    it("should share a pending range between a prefetch and the page that needs it", async () => {
+      addBlock(1);
+      addBlock(2);
+      const dataService = createDataService();
+
+      const prefetch = dataService.getBlocks([2, 1]);
+      const blocks = await dataService.getBlocks([2, 1]);
+      await prefetch;
+
+      expect(blocks).toHaveLength(2);
+      expect(countRequests("eth_getBlockByNumber")).toBe(2);
+    });
+
+    it("should fetch blocks one by one when the endpoint rejects batches", async () => {
+      addBlock(1);
+      addBlock(2);
+      node.rejectBatches = true;
+      const dataService = createDataService();
+
+      const blocks = await dataService.getBlocks([2, 1]);
+
+      expect(blocks.map((block) => Number(block.number))).toEqual([2, 1]);
+      expect(countRequests("eth_getBlockByNumber")).toBe(2);
+    });
+  });
+
+  describe("getTransactions", () => {
+    it("should add the block timestamp and serve later lookups from cache", async () => {
+      addBlock(5);
+      addTransaction("0xaa", 5);
+      const dataService = createDataService();
+
+      const [transaction] = await dataService.getTransactions(["0xaa"]);
+      expect(transaction?.timestamp).toBe(String(1700000005));
+
+      node.requests.length = 0;
+      const { data } = await dataService.getTransaction("0xaa");
+      expect(data.timestamp).toBe(String(1700000005));
+      expect(node.requests).toEqual([]);
+    });
+
+    it("should not cache a transaction whose block could not be loaded", async () => {
+      addTransaction("0xaa", 5);
+      const dataService = createDataService();
+
+      const [transaction] = await dataService.getTransactions(["0xaa"]);
+      expect(transaction?.hash).toBe("0xaa");
+      expect(transaction?.timestamp).toBeUndefined();
+
+      addBlock(5);
+      node.requests.length = 0;
+      const { data } = await dataService.getTransaction("0xaa");
+      expect(data.timestamp).toBe(String(1700000005));
+      expect(countRequests("eth_getTransactionByHash")).toBe(1);
+    });
+
+    it("should fetch transactions one by one when the endpoint rejects batches", async () => {
+      addBlock(5);
+      addTransaction("0xaa", 5);
+      addTransaction("0xbb", 5);
+      node.rejectBatches = true;
+      const dataService = createDataService();
+
+      const transactions = await dataService.getTransactions(["0xaa", "0xcc", "0xbb"]);
+
+      expect(transactions.map((tx) => tx.hash)).toEqual(["0xaa", "0xbb"]);
+      expect(transactions.every((tx) => tx.timestamp === String(1700000005))).toBe(true);
+    });
+  });
+});
@@ -7,8 +7,10 @@ import type {
   Block,
   DataWithMetadata,
   NetworkStats,
+  RPCBlock,
   RPCMetadata,
   RPCStrategy,
+  RPCTransaction,
   RpcUrlsContextType,
   Transaction,
 } from "../types";
@@ -42,8 +44,24 @@ import { RPCMetadataService } from "./RPCMetadataService";
 interface CacheEntry<T> {
   data: T;
   timestamp: number;
+  // Overrides the default cache timeout, Infinity for data that can no longer change
+  timeout?: number;
+  // Provider comparison the data was fetched with in parallel mode
+  metadata?: RPCMetadata;
 }
 
+// How long the latest block number is reused per network: about one block time, but at
+// least a second so a burst of lookups from one page still shares a request. Networks not
+// listed use 5 seconds, under the 12 second slots of Ethereum and its testnets
+const LATEST_BLOCK_CACHE_TIMEOUTS: Record<number, number> = {
+  42161: 1000, // Arbitrum One, ~0.25s blocks
+  10: 2000, // Optimism, 2s blocks
+  8453: 2000, // Base, 2s blocks
+  137: 2000, // Polygon PoS, ~2s blocks
+  56: 1000, // BNB Smart Chain, 0.75s blocks
+  31337: 1000, // Hardhat, mines a block for every transaction
+};
+
 export class DataService {
   private rpcClient: RPCClient;
   private blockFetcher: BlockFetcher | BlockFetcherArbitrum | BlockFetcherOptimism;
@@ -65,6 +83,14 @@ export class DataService {
   // biome-ignore lint/suspicious/noExplicitAny: <TODO>
   private cache = new Map<string, CacheEntry<any>>();
   private cacheTimeout = 30000; // 30 seconds
+  private maxCacheEntries = 1000;
+  // Blocks this far below the chain head are treated as final and cached without expiry
+  private finalizedBlockDepth = 64;
+  private latestKnownBlockNumber: number | null = null;
+  // The latest block number changes with every block, so it is only reused for about a block
+  private latestBlockCacheTimeout: number;
+  // Requests currently being fetched, so concurrent identical calls share one round trip
+  private inFlight = new Map<string, Promise<unknown>>();
 
   constructor(
     private networkId: number,
@@ -84,6 +110,7 @@ export class DataService {
     // OP Stack chains: Optimism (10), Base (8453)
     this.isOptimism = networkId === 10 || networkId === 8453;
     this.isLocalhost = networkId === 31337;
+    this.latestBlockCacheTimeout = LATEST_BLOCK_CACHE_TIMEOUTS[networkId] ?? 5000;
 
     // Initialize trace fetcher for all networks (will check availability when used)
     this.traceFetcher = new TraceFetcher(this.rpcClient);
@@ -110,34 +137,113 @@ export class DataService {
     const entry = this.cache.get(key);
     if (!entry) return null;
 
-    const isExpired = Date.now() - entry.timestamp > this.cacheTimeout;
+    const isExpired = Date.now() - entry.timestamp > (entry.timeout ?? this.cacheTimeout);
     if (isExpired) {
       this.cache.delete(key);
       return null;
     }
 
+    // Move the entry to the end so the least recently used entries are evicted first
+    this.cache.delete(key);
+    this.cache.set(key, entry);
+
     return entry.data;
   }
 
-  private setCache<T>(key: string, data: T): void {
-    this.cache.set(key, { data, timestamp: Date.now() });
+  private setCache<T>(key: string, data: T, timeout?: number, metadata?: RPCMetadata): void {
+    this.cache.delete(key);
+    this.cache.set(key, { data, timestamp: Date.now(), timeout, metadata });
+
+    while (this.cache.size > this.maxCacheEntries) {
+      const oldestKey = this.cache.keys().next().value;
+      if (oldestKey === undefined) break;
+      this.cache.delete(oldestKey);
+    }
+  }
+
+  /**
+   * Cached response for a page, with the provider comparison it was fetched with. In
+   * parallel mode an entry without one (filled by a batch lookup or before the strategy
+   * changed) counts as a miss, so revisiting a page still compares providers
+   */
+  private getCachedResponse<T>(key: string): DataWithMetadata<T> | null {
+    const metadata = this.cache.get(key)?.metadata;
+    if (!metadata && this.rpcClient.getStrategy() === "parallel") return null;
+
+    const data = this.getCached<T>(key);
+    if (!data) return null;
+    return metadata ? { data, metadata } : { data };
+  }
+
+  /**
+   * Cache timeout for data belonging to a block: finalized blocks can no longer
+   * change, so they never expire. Recent blocks use the default timeout since they
+   * may still be reorganized. Local dev chains can be restarted or reset at any
+   * height, so their blocks are never treated as final.
+   */
+  private getBlockCacheTimeout(blockNumber: number): number | undefined {
+    if (this.isLocalhost) return undefined;
+    if (
+      this.latestKnownBlockNumber !== null &&
+      blockNumber <= this.latestKnownBlockNumber - this.finalizedBlockDepth
+    ) {
+      return Number.POSITIVE_INFINITY;
+    }
+    return undefined;
+  }
+
+  /**
+   * Drop cached blocks and transactions above the given block number, they belong to a
+   * chain that no longer exists once the head has moved back below them
+   */
+  private clearCacheAboveBlock(blockNumber: number): void {
+    const staleKeys: string[] = [];
+    this.cache.forEach((entry, key) => {
+      const entryBlockNumber = Number(entry.data?.blockNumber ?? entry.data?.number);
+      if (entryBlockNumber > blockNumber) staleKeys.push(key);
+    });
+    staleKeys.forEach((key) => {
+      this.cache.delete(key);
+    });
   }
 
   private getCacheKey(prefix: string, identifier: string | number): string {
     return `${this.networkId}:${prefix}:${identifier}`;
   }
 
+  /**
+   * Share a pending fetch between concurrent callers asking for the same key
+   */
+  private coalesce<T>(key: string, fetcher: () => Promise<T>): Promise<T> {
+    const pending = this.inFlight.get(key);
+    if (pending) return pending as Promise<T>;
+
+    const promise = fetcher().finally(() => {
+      this.inFlight.delete(key);
+    });
+    this.inFlight.set(key, promise);
+    return promise;
+  }
+
   async getBlock(blockNumber: number | "latest"): Promise<DataWithMetadata<Block>> {
     const cacheKey = this.getCacheKey("block", blockNumber);
-    const cached = this.getCached<Block>(cacheKey);
-    if (cached) return { data: cached };
+    const cached = this.getCachedResponse<Block>(cacheKey);
+    if (cached) return cached;
 
+    return this.coalesce(cacheKey, () => this.fetchBlock(blockNumber, cacheKey));
+  }
+
+  private async fetchBlock(
+    blockNumber: number | "latest",
+    cacheKey: string,
+  ): Promise<DataWithMetadata<Block>> {
     // Check if parallel strategy is enabled
     if (this.rpcClient.getStrategy() === "parallel") {
-      // Use parallel call to get all responses
+      // Use parallel call to get all responses. Block objects only keep transaction hashes,
+      // so full transaction objects are not requested
       const results = await this.rpcClient.parallelCall("eth_getBlockByNumber", [
         typeof blockNumber === "number" ? `0x${blockNumber.toString(16)}` : blockNumber,
-        true,
+        false,
       ]);
 
       // Build complete block objects for each provider
@@ -169,9 +275,11 @@ export class DataService {
         throw new Error("All RPC endpoints failed");
       }
 
-      // Only cache non-latest blocks
+      // Only cache non-latest blocks, the latest one still tells us the chain head
       if (blockNumber !== "latest") {
-        this.setCache(cacheKey, defaultBlock);
+        this.setCache(cacheKey, defaultBlock, this.getBlockCacheTimeout(blockNumber), metadata);
+      } else {
+        this.recordLatestBlockNumber(Number(defaultBlock.number));
       }
 
       return { data: defaultBlock, metadata };
@@ -186,15 +294,69 @@ export class DataService {
           ? BlockOptimismAdapter.fromRPCBlock(rpcBlock, this.networkId)
           : BlockAdapter.fromRPCBlock(rpcBlock, this.networkId);
 
-      // Only cache non-latest blocks
+      // Only cache non-latest blocks, the latest one still tells us the chain head
       if (blockNumber !== "latest") {
-        this.setCache(cacheKey, block);
+        this.setCache(cacheKey, block, this.getBlockCacheTimeout(blockNumber));
+      } else {
+        this.recordLatestBlockNumber(Number(block.number));
       }
 
       return { data: block };
     }
   }
 
+  /**
+   * Get several blocks at once, serving cached blocks from memory and fetching
+   * the rest in a single batch request instead of one request per block.
+   * Blocks that are not found are skipped.
+   */
+  async getBlocks(blockNumbers: number[]): Promise<Block[]> {
+    // A page opened while its prefetch is still in flight waits for it instead of
+    // requesting the same range again
+    return this.coalesce(this.getCacheKey("blocks", blockNumbers.join(",")), () =>
+      this.fetchBlocks(blockNumbers),
+    );
+  }
+
+  private async fetchBlocks(blockNumbers: number[]): Promise<Block[]> {
+    const blocks = new Map<number, Block>();
+    const missing: number[] = [];
+
+    for (const blockNumber of blockNumbers) {
+      const cached = this.getCached<Block>(this.getCacheKey("block", blockNumber));
+      if (cached) {
+        blocks.set(blockNumber, cached);
+      } else {
+        missing.push(blockNumber);
+      }
+    }
+
+    if (missing.length > 0) {
+      const rpcBlocks = await this.blockFetcher.getBlocks(missing);
+      missing.forEach((blockNumber, index) => {
+        const rpcBlock = rpcBlocks[index];
+        if (!rpcBlock) return;
+
+        const block = this.isArbitrum
+          ? BlockArbitrumAdapter.fromRPCBlock(rpcBlock, this.networkId)
+          : this.isOptimism
+            ? BlockOptimismAdapter.fromRPCBlock(rpcBlock, this.networkId)
+            : BlockAdapter.fromRPCBlock(rpcBlock, this.networkId);
+
+        this.setCache(
+          this.getCacheKey("block", blockNumber),
+          block,
+          this.getBlockCacheTimeout(blockNumber),
+        );
+        blocks.set(blockNumber, block);
+      });
+    }
+
+    return blockNumbers
+      .map((blockNumber) => blocks.get(blockNumber))
+      .filter((block): block is Block => block !== undefined);
+  }
+
   async getBlockWithTransactions(
     blockNumber: number | "latest",
   ): Promise<Block & { transactionDetails: Transaction[] }> {
@@ -226,13 +388,23 @@ export class DataService {
 
   async getTransaction(txHash: string): Promise<DataWithMetadata<Transaction>> {
     const cacheKey = this.getCacheKey("tx", txHash);
-    const cached = this.getCached<Transaction>(cacheKey);
-    if (cached) return { data: cached };
+    const cached = this.getCachedResponse<Transaction>(cacheKey);
+    if (cached) return cached;
 
+    return this.coalesce(cacheKey, () => this.fetchTransaction(txHash, cacheKey));
+  }
+
+  private async fetchTransaction(
+    txHash: string,
+    cacheKey: string,
+  ): Promise<DataWithMetadata<Transaction>> {
     // Check if parallel strategy is enabled
     if (this.rpcClient.getStrategy() === "parallel") {
-      // Use parallel call for transaction
-      const results = await this.rpcClient.parallelCall("eth_getTransactionByHash", [txHash]);
+      // Request the transaction and its receipt together (receipt uses the same strategy)
+      const [results, receiptResults] = await Promise.all([
+        this.rpcClient.parallelCall("eth_getTransactionByHash", [txHash]),
+        this.rpcClient.parallelCall("eth_getTransactionReceipt", [txHash]),
+      ]);
 
       // Find first successful response
       const successfulResult = results.find((r) => r.status === "fulfilled");
@@ -242,11 +414,6 @@ export class DataService {
 
       const rpcTx = successfulResult.response;
 
-      // Get receipt (use same strategy)
-      const receiptResults = await this.rpcClient.parallelCall("eth_getTransactionReceipt", [
-        txHash,
-      ]);
-
       // Get timestamp from block if available
       let timestamp: string = "";
       let baseFeePerGas: string | undefined;
@@ -310,7 +477,12 @@ export class DataService {
         throw new Error("Failed to create transaction object");
       }
 
-      this.setCache(cacheKey, defaultTransaction);
+      this.setCache(
+        cacheKey,
+        defaultTransaction,
+        rpcTx.blockNumber ? this.getBlockCacheTimeout(parseInt(rpcTx.blockNumber, 16)) : undefined,
+        metadata,
+      );
       return { data: defaultTransaction, metadata };
     } else {
       // Fallback strategy
@@ -344,28 +516,130 @@ export class DataService {
         transaction.blockBaseFeePerGas = baseFeePerGas;
       }
 
-      this.setCache(cacheKey, transaction);
+      this.setCache(
+        cacheKey,
+        transaction,
+        rpcTx.blockNumber ? this.getBlockCacheTimeout(parseInt(rpcTx.blockNumber, 16)) : undefined,
+      );
       return { data: transaction };
     }
   }
 
+  /**
+   * Get several transactions at once. Transactions and receipts are fetched in a
+   * single batch request and the blocks they belong to in a second one, instead
+   * of three requests per transaction. Transactions that are not found are skipped.
+   */
+  async getTransactions(txHashes: string[]): Promise<Transaction[]> {
+    const transactions = new Map<string, Transaction>();
+    const missing: string[] = [];
+
+    for (const txHash of txHashes) {
+      const cached = this.getCached<Transaction>(this.getCacheKey("tx", txHash));
+      if (cached) {
+        transactions.set(txHash, cached);
+      } else {
+        missing.push(txHash);
+      }
+    }
+
+    const fetched = await this.transactionFetcher
+      .getTransactionsWithReceipts(missing)
+      .catch((error) => {
+        console.warn("Batch transaction request failed, fetching individually:", error);
+        return null;
+      });
+
+    if (!fetched) {
+      // Some providers reject batch requests, fall back to one request per transaction
+      const results = await Promise.all(
+        missing.map((txHash) => this.getTransaction(txHash).catch(() => null)),
+      );
+      results.forEach((result, index) => {
+        const txHash = missing[index];
+        if (result && txHash) transactions.set(txHash, result.data);
+      });
+    } else if (fetched.length > 0) {
+      // Resolve timestamps and base fees with one lookup per distinct block
+      const blockNumbers: number[] = [];
+      for (const { transaction: rpcTx } of fetched) {
+        if (!rpcTx?.blockNumber) continue;
+        const blockNumber = parseInt(rpcTx.blockNumber, 16);
+        if (!blockNumbers.includes(blockNumber)) blockNumbers.push(blockNumber);
+      }
+      const blocks = await this.getBlocks(blockNumbers).catch((error) => {
+        console.error("Error fetching transaction blocks:", error);
+        return [] as Block[];
+      });
+      const blocksByNumber = new Map<number, Block>();
+      for (const block of blocks) {
+        blocksByNumber.set(Number(block.number), block);
+      }
+
+      fetched.forEach(({ transaction: rpcTx, receipt }, index) => {
+        const txHash = missing[index];
+        if (!rpcTx || !txHash) return;
+
+        const transaction = this.isArbitrum
+          ? TransactionArbitrumAdapter.fromRPCTransaction(rpcTx, this.networkId, receipt)
+          : this.isOptimism
+            ? TransactionOptimismAdapter.fromRPCTransaction(rpcTx, this.networkId, receipt)
+            : TransactionAdapter.fromRPCTransaction(rpcTx, this.networkId, receipt);
+
+        const blockNumber = rpcTx.blockNumber ? parseInt(rpcTx.blockNumber, 16) : undefined;
+        const block = blockNumber !== undefined ? blocksByNumber.get(blockNumber) : undefined;
+        if (block) {
+          transaction.timestamp = block.timestamp.toString();
+          if (block.baseFeePerGas) {
+            transaction.blockBaseFeePerGas = block.baseFeePerGas;
+          }
+        }
+
+        // A transaction whose block could not be loaded has no timestamp or base fee, it
+        // is listed as is but not cached, so the transaction page fetches it in full
+        if (blockNumber === undefined || block) {
+          this.setCache(
+            this.getCacheKey("tx", txHash),
+            transaction,
+            blockNumber !== undefined ? this.getBlockCacheTimeout(blockNumber) : undefined,
+          );
+        }
+        transactions.set(txHash, transaction);
+      });
+    }
+
+    return txHashes
+      .map((txHash) => transactions.get(txHash))
+      .filter((tx): tx is Transaction => tx !== undefined);
+  }
+
   async getAddress(address: string): Promise<DataWithMetadata<Address>> {
-    const cacheKey = this.getCacheKey("address", address);
-    const cached = this.getCached<Address>(cacheKey);
-    if (cached) return { data: cached };
+    // Addresses are case-insensitive, normalize once so lookups and filters compare plain strings
+    const normalizedAddress = address.toLowerCase();
+    const cacheKey = this.getCacheKey("address", normalizedAddress);
+    const cached = this.getCachedResponse<Address>(cacheKey);
+    if (cached) return cached;
+
+    return this.coalesce(cacheKey, () => this.fetchAddress(normalizedAddress, cacheKey));
+  }
 
+  /**
+   * @param address - Lowercased address, so the cached data doesn't depend on the casing
+   * the first caller used
+   */
+  private async fetchAddress(
+    address: string,
+    cacheKey: string,
+  ): Promise<DataWithMetadata<Address>> {
     let metadata: RPCMetadata | undefined;
     let addressData: Address;
 
     if (this.rpcClient.getStrategy() === "parallel") {
       // Parallel strategy: query all providers simultaneously
       const [balanceResults, codeResults, txCountResults] = await Promise.all([
-        this.rpcClient.parallelCall<string>("eth_getBalance", [address.toLowerCase(), "latest"]),
-        this.rpcClient.parallelCall<string>("eth_getCode", [address.toLowerCase(), "latest"]),
-        this.rpcClient.parallelCall<string>("eth_getTransactionCount", [
-          address.toLowerCase(),
-          "latest",
-        ]),
+        this.rpcClient.parallelCall<string>("eth_getBalance", [address, "latest"]),
+        this.rpcClient.parallelCall<string>("eth_getCode", [address, "latest"]),
+        this.rpcClient.parallelCall<string>("eth_getTransactionCount", [address, "latest"]),
       ]);
 
       // Build complete address objects for each provider
@@ -448,8 +722,8 @@ export class DataService {
         if (block.transactionDetails) {
           const addressTxs = block.transactionDetails.filter(
             (tx: Transaction) =>
-              tx.from?.toLowerCase() === address.toLowerCase() ||
-              tx.to?.toLowerCase() === address.toLowerCase(),
+              tx.from?.toLowerCase() === address ||
+              tx.to?.toLowerCase() === address,
           );
           recentTransactions.push(...addressTxs);
           if (recentTransactions.length >= 10) break;
@@ -462,7 +736,7 @@ export class DataService {
       addressData.recentTransactions = [];
     }
 
-    this.setCache(cacheKey, addressData);
+    this.setCache(cacheKey, addressData, undefined, metadata);
     return { data: addressData, metadata };
   }
 
@@ -501,14 +775,49 @@ export class DataService {
   }
 
   async getLatestBlockNumber(): Promise<number> {
-    return await this.blockFetcher.getLatestBlockNumber();
+    const cacheKey = this.getCacheKey("latestBlockNumber", "current");
+    const cached = this.getCached<number>(cacheKey);
+    if (cached !== null) return cached;
+
+    return this.coalesce(cacheKey, async () => {
+      const latestBlockNumber = await this.blockFetcher.getLatestBlockNumber();
+      this.recordLatestBlockNumber(latestBlockNumber, true);
+      return latestBlockNumber;
+    });
+  }
+
+  /**
+   * Remember the chain head seen in any response, so getLatestBlockNumber can answer
+   * from cache instead of sending its own eth_blockNumber request.
+   * The head only moves forwards, since a lower value usually comes from a lagging
+   * endpoint. The exception is an authoritative eth_blockNumber result on a local dev
+   * chain, which really goes backwards when the node is restarted or reset.
+   */
+  private recordLatestBlockNumber(blockNumber: number, authoritative = false): void {
+    if (Number.isNaN(blockNumber)) return;
+    if (this.latestKnownBlockNumber !== null && blockNumber < this.latestKnownBlockNumber) {
+      if (!authoritative || !this.isLocalhost) return;
+      // The chain was reset, anything cached above the new head is gone
+      this.clearCacheAboveBlock(blockNumber);
+    }
+
+    this.latestKnownBlockNumber = blockNumber;
+    this.setCache(
+      this.getCacheKey("latestBlockNumber", "current"),
+      blockNumber,
+      this.latestBlockCacheTimeout,
+    );
   }
 
   async getNetworkStats(): Promise<DataWithMetadata<NetworkStats>> {
     const cacheKey = this.getCacheKey("networkStats", "current");
-    const cached = this.getCached<NetworkStats>(cacheKey);
-    if (cached) return { data: cached };
+    const cached = this.getCachedResponse<NetworkStats>(cacheKey);
+    if (cached) return cached;
+
+    return this.coalesce(cacheKey, () => this.fetchNetworkStats(cacheKey));
+  }
 
+  private async fetchNetworkStats(cacheKey: string): Promise<DataWithMetadata<NetworkStats>> {
     let metadata: RPCMetadata | undefined;
 
     if (this.rpcClient.getStrategy() === "parallel") {
@@ -584,12 +893,14 @@ export class DataService {
         throw new Error("Failed to fetch network stats from all providers");
       }
 
-      this.cache.set(cacheKey, { data: defaultStats, timestamp: Date.now() });
+      this.setCache(cacheKey, defaultStats, undefined, metadata);
+      this.recordLatestBlockNumber(Number(defaultStats.currentBlockNumber));
       return { data: defaultStats, metadata };
     } else {
       // Fallback strategy: use sequential fetching
       const stats = await this.networkStatsFetcher.getNetworkStats();
-      this.cache.set(cacheKey, { data: stats, timestamp: Date.now() });
+      this.setCache(cacheKey, stats);
+      this.recordLatestBlockNumber(Number(stats.currentBlockNumber));
       return { data: stats };
     }
   }
@@ -600,9 +911,7 @@ export class DataService {
       (num) => num >= 0,
     ); // Don't go below block 0
 
-    const blockResults = await Promise.all(blockNumbers.map((num) => this.getBlock(num)));
-
-    return blockResults.map((result) => result.data);
+    return await this.getBlocks(blockNumbers);
   }
 
   async getTransactionsFromLatestBlocks(
@@ -613,25 +922,9 @@ export class DataService {
       (num) => num >= 0,
     );
 
-    // Fetch blocks with full transaction details
-    const blocksWithTxs = await Promise.all(
-      blockNumbers.map((num) => this.getBlockWithTransactions(num)),
-    );
-
-    // Flatten all transactions from all blocks, maintaining block order
-    const transactions: Array<Transaction & { blockNumber: string }> = [];
-    for (const block of blocksWithTxs) {
-      if (block.transactionDetails && block.transactionDetails.length > 0) {
-        for (const tx of block.transactionDetails) {
-          transactions.push({
-            ...tx,
-            blockNumber: block.number,
-          });
-        }
-      }
-    }
-
-    return transactions;
+    // Fetch blocks with full transaction details in batch requests
+    const rpcBlocks = await this.blockFetcher.getBlocksWithTransactions(blockNumbers);
+    return this.flattenBlockTransactions(rpcBlocks);
   }
 
   async getTransactionsFromBlockRange(
@@ -643,21 +936,33 @@ export class DataService {
       (num) => num >= 0,
     );
 
-    // Fetch blocks with full transaction details
-    const blocksWithTxs = await Promise.all(
-      blockNumbers.map((num) => this.getBlockWithTransactions(num)),
-    );
+    // Fetch blocks with full transaction details in batch requests
+    const rpcBlocks = await this.blockFetcher.getBlocksWithTransactions(blockNumbers);
+    return this.flattenBlockTransactions(rpcBlocks);
+  }
 
-    // Flatten all transactions from all blocks, maintaining block order
+  /**
+   * Adapt the transactions of raw blocks straight into one list, maintaining block order,
+   * without building the intermediate block objects the list never uses
+   */
+  private flattenBlockTransactions(
+    rpcBlocks: Array<RPCBlock | null>,
+  ): Array<Transaction & { blockNumber: string }> {
     const transactions: Array<Transaction & { blockNumber: string }> = [];
-    for (const block of blocksWithTxs) {
-      if (block.transactionDetails && block.transactionDetails.length > 0) {
-        for (const tx of block.transactionDetails) {
-          transactions.push({
-            ...tx,
-            blockNumber: block.number,
-          });
-        }
+    for (const rpcBlock of rpcBlocks) {
+      if (!rpcBlock || !Array.isArray(rpcBlock.transactions)) continue;
+
+      for (const tx of rpcBlock.transactions as Array<string | RPCTransaction>) {
+        if (typeof tx === "string") continue;
+
+        const transaction = this.isArbitrum
+          ? TransactionArbitrumAdapter.fromRPCTransaction(tx, this.networkId)
+          : this.isOptimism
+            ? TransactionOptimismAdapter.fromRPCTransaction(tx, this.networkId)
+            : TransactionAdapter.fromRPCTransaction(tx, this.networkId);
+        // The adapted object is fresh, so tag it in place rather than copying every field
+        transaction.blockNumber = rpcBlock.number;
+        transactions.push(transaction);
       }
     }
 
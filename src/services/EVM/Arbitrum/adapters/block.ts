@@ -5,10 +5,10 @@ import type { BlockArbitrum } from "../../../../types";
 export class BlockArbitrumAdapter {
   // biome-ignore lint/suspicious/noExplicitAny: <TODO>
   static fromRPCBlock(rpcBlock: any, _networkId: number): BlockArbitrum {
-    console.log("Arbitrum block:", rpcBlock);
     const timestamp = rpcBlock.timestamp
       ? parseInt(rpcBlock.timestamp, rpcBlock.timestamp.startsWith("0x") ? 16 : 10).toString()
       : "0";
+    const difficulty = BigInt(rpcBlock.difficulty || 0).toString();
     return {
       number: rpcBlock.number,
       hash: rpcBlock.hash,
@@ -16,7 +16,7 @@ export class BlockArbitrumAdapter {
       timestamp,
       baseFeePerGas: rpcBlock.baseFeePerGas ? BigInt(rpcBlock.baseFeePerGas).toString() : undefined,
       nonce: rpcBlock.nonce,
-      difficulty: BigInt(rpcBlock.difficulty || 0).toString(),
+      difficulty,
       gasLimit: BigInt(rpcBlock.gasLimit).toString(),
       gasUsed: BigInt(rpcBlock.gasUsed).toString(),
       miner: rpcBlock.miner,
@@ -33,7 +33,7 @@ export class BlockArbitrumAdapter {
       uncles: rpcBlock.uncles || [],
       mixHash: rpcBlock.mixHash,
       sha3Uncles: rpcBlock.sha3Uncles,
-      totalDifficulty: BigInt(rpcBlock.difficulty || 0).toString(),
+      totalDifficulty: difficulty,
       blobGasUsed: rpcBlock.blobGasUsed,
       excessBlobGas: rpcBlock.excessBlobGas,
       withdrawalsRoot: rpcBlock.withdrawalsRoot,
@@ -17,6 +17,30 @@ export class TransactionFetcher {
     return await this.rpcClient.call<RPCTransactionReceipt>("eth_getTransactionReceipt", [txHash]);
   }
 
+  /**
+   * Fetch several transactions and their receipts in a single JSON-RPC batch request
+   */
+  async getTransactionsWithReceipts(txHashes: string[]): Promise<
+    Array<{
+      transaction: RPCTransaction | null;
+      receipt: RPCTransactionReceipt | null;
+    }>
+  > {
+    if (txHashes.length === 0) return [];
+
+    const results = await this.rpcClient.batchCall(
+      txHashes.flatMap((txHash) => [
+        { method: "eth_getTransactionByHash", params: [txHash] },
+        { method: "eth_getTransactionReceipt", params: [txHash] },
+      ]),
+    );
+
+    return txHashes.map((_, index) => ({
+      transaction: (results[index * 2] as RPCTransaction | null | undefined) ?? null,
+      receipt: (results[index * 2 + 1] as RPCTransactionReceipt | null | undefined) ?? null,
+    }));
+  }
+
   async getTransactionCount(
     address: string,
     blockNumber: number | "latest" = "latest",
@@ -4,10 +4,11 @@ import type { Block, RPCBlock } from "../../../../types";
 // biome-ignore lint/complexity/noStaticOnlyClass: <TODO>
 export class BlockAdapter {
   static fromRPCBlock(rpcBlock: RPCBlock, _networkId: number): Block {
-    console.log(rpcBlock);
     const timestamp = rpcBlock.timestamp
       ? parseInt(rpcBlock.timestamp, rpcBlock.timestamp.startsWith("0x") ? 16 : 10).toString()
       : "0";
+    // Converted once and reused, the adapter reports it as both difficulty and totalDifficulty
+    const difficulty = BigInt(rpcBlock.difficulty).toString();
     return {
       number: rpcBlock.number,
       hash: rpcBlock.hash,
@@ -15,7 +16,7 @@ export class BlockAdapter {
       timestamp,
       baseFeePerGas: rpcBlock.baseFeePerGas ? BigInt(rpcBlock.baseFeePerGas).toString() : undefined,
       nonce: rpcBlock.nonce,
-      difficulty: BigInt(rpcBlock.difficulty).toString(),
+      difficulty,
       gasLimit: BigInt(rpcBlock.gasLimit).toString(),
       gasUsed: BigInt(rpcBlock.gasUsed).toString(),
       miner: rpcBlock.miner,
@@ -31,7 +32,7 @@ export class BlockAdapter {
       uncles: rpcBlock.uncles,
       mixHash: rpcBlock.mixHash,
       sha3Uncles: rpcBlock.sha3Uncles,
-      totalDifficulty: BigInt(rpcBlock.difficulty).toString(),
+      totalDifficulty: difficulty,
       blobGasUsed: rpcBlock.blobGasUsed,
       excessBlobGas: rpcBlock.excessBlobGas,
       withdrawalsRoot: rpcBlock.withdrawalsRoot,
@@ -53,23 +53,27 @@ export class AddressFetcher {
   ): Promise<TraceFilterResult[]> {
     const fromBlockParam = fromBlock === "earliest" ? "earliest" : `0x${fromBlock.toString(16)}`;
     const toBlockParam = toBlock === "latest" ? "latest" : `0x${toBlock.toString(16)}`;
-
-    // Get traces where address is sender
-    const fromTraces = await this.rpcClient.call<TraceFilterResult[]>("trace_filter", [
-      {
-        fromBlock: fromBlockParam,
-        toBlock: toBlockParam,
-        fromAddress: [address],
-      },
-    ]);
-
-    // Get traces where address is receiver
-    const toTraces = await this.rpcClient.call<TraceFilterResult[]>("trace_filter", [
-      {
-        fromBlock: fromBlockParam,
-        toBlock: toBlockParam,
-        toAddress: [address],
-      },
+    // Nodes compare filter addresses case-insensitively, but send one canonical form
+    const normalizedAddress = address.toLowerCase();
+
+    // Sender and receiver traces are independent, request them concurrently
+    const [fromTraces, toTraces] = await Promise.all([
+      // Get traces where address is sender
+      this.rpcClient.call<TraceFilterResult[]>("trace_filter", [
+        {
+          fromBlock: fromBlockParam,
+          toBlock: toBlockParam,
+          fromAddress: [normalizedAddress],
+        },
+      ]),
+      // Get traces where address is receiver
+      this.rpcClient.call<TraceFilterResult[]>("trace_filter", [
+        {
+          fromBlock: fromBlockParam,
+          toBlock: toBlockParam,
+          toAddress: [normalizedAddress],
+        },
+      ]),
     ]);
 
     // Combine and deduplicate by transaction hash
@@ -95,33 +99,35 @@ export class AddressFetcher {
     // Approval: 0x8c5be1e5ebec7d5bd14f714f211d1fdf2f9d4b67e8936cfd6c3b6c0e16b3b4f2
 
     // Pad address to 32 bytes for topic filtering
-    const paddedAddress = `0x${address.toLowerCase().slice(2).padStart(64, "0")}`;
-
-    // Get logs emitted BY this address (for contracts)
-    const logsFromContract = await this.rpcClient.call<LogEntry[]>("eth_getLogs", [
-      {
-        fromBlock: fromBlockParam,
-        toBlock: toBlockParam,
-        address: address,
-      },
-    ]);
-
-    // Get logs where address is in topic1 (common for from/owner in Transfer/Approval)
-    const logsAsTopic1 = await this.rpcClient.call<LogEntry[]>("eth_getLogs", [
-      {
-        fromBlock: fromBlockParam,
-        toBlock: toBlockParam,
-        topics: [null, paddedAddress],
-      },
-    ]);
-
-    // Get logs where address is in topic2 (common for to/spender in Transfer/Approval)
-    const logsAsTopic2 = await this.rpcClient.call<LogEntry[]>("eth_getLogs", [
-      {
-        fromBlock: fromBlockParam,
-        toBlock: toBlockParam,
-        topics: [null, null, paddedAddress],
-      },
+    const normalizedAddress = address.toLowerCase();
+    const paddedAddress = `0x${normalizedAddress.slice(2).padStart(64, "0")}`;
+
+    // The three log queries are independent, request them concurrently
+    const [logsFromContract, logsAsTopic1, logsAsTopic2] = await Promise.all([
+      // Get logs emitted BY this address (for contracts)
+      this.rpcClient.call<LogEntry[]>("eth_getLogs", [
+        {
+          fromBlock: fromBlockParam,
+          toBlock: toBlockParam,
+          address: normalizedAddress,
+        },
+      ]),
+      // Get logs where address is in topic1 (common for from/owner in Transfer/Approval)
+      this.rpcClient.call<LogEntry[]>("eth_getLogs", [
+        {
+          fromBlock: fromBlockParam,
+          toBlock: toBlockParam,
+          topics: [null, paddedAddress],
+        },
+      ]),
+      // Get logs where address is in topic2 (common for to/spender in Transfer/Approval)
+      this.rpcClient.call<LogEntry[]>("eth_getLogs", [
+        {
+          fromBlock: fromBlockParam,
+          toBlock: toBlockParam,
+          topics: [null, null, paddedAddress],
+        },
+      ]),
     ]);
 
     // Combine all logs and deduplicate
@@ -148,14 +154,6 @@ export class AddressFetcher {
     try {
       const traces = await this.getTransactionsFromTrace(address, fromBlock, toBlock);
 
-      // Extract unique transaction hashes
-      const txHashes = new Set<string>();
-      for (const trace of traces) {
-        if (trace.transactionHash) {
-          txHashes.add(trace.transactionHash);
-        }
-      }
-
       // Sort by block number (most recent first)
       const sortedTraces = traces.sort((a, b) => b.blockNumber - a.blockNumber);
       const sortedHashes: string[] = [];
@@ -182,14 +180,6 @@ export class AddressFetcher {
     try {
       const logs = await this.getLogsForAddress(address, fromBlock, toBlock);
 
-      // Extract unique transaction hashes
-      const txHashes = new Set<string>();
-      for (const log of logs) {
-        if (log.transactionHash) {
-          txHashes.add(log.transactionHash);
-        }
-      }
-
       // Sort by block number (most recent first)
       const sortedLogs = logs.sort(
         (a, b) => parseInt(b.blockNumber, 16) - parseInt(a.blockNumber, 16),
@@ -4,10 +4,10 @@ import type { Block, RPCBlock } from "../../../../types";
 // biome-ignore lint/complexity/noStaticOnlyClass: <TODO>
 export class BlockOptimismAdapter {
   static fromRPCBlock(rpcBlock: RPCBlock, _networkId: number): Block {
-    console.log("Optimism block:", rpcBlock);
     const timestamp = rpcBlock.timestamp
       ? parseInt(rpcBlock.timestamp, rpcBlock.timestamp.startsWith("0x") ? 16 : 10).toString()
       : "0";
+    const difficulty = BigInt(rpcBlock.difficulty || 0).toString();
     // Optimism blocks use the same format as Ethereum
     return {
       number: rpcBlock.number,
@@ -16,7 +16,7 @@ export class BlockOptimismAdapter {
       timestamp,
       baseFeePerGas: rpcBlock.baseFeePerGas ? BigInt(rpcBlock.baseFeePerGas).toString() : undefined,
       nonce: rpcBlock.nonce,
-      difficulty: BigInt(rpcBlock.difficulty || 0).toString(),
+      difficulty,
       gasLimit: BigInt(rpcBlock.gasLimit).toString(),
       gasUsed: BigInt(rpcBlock.gasUsed).toString(),
       miner: rpcBlock.miner,
@@ -33,7 +33,7 @@ export class BlockOptimismAdapter {
       uncles: rpcBlock.uncles || [],
       mixHash: rpcBlock.mixHash,
       sha3Uncles: rpcBlock.sha3Uncles,
-      totalDifficulty: BigInt(rpcBlock.difficulty || 0).toString(),
+      totalDifficulty: difficulty,
       blobGasUsed: rpcBlock.blobGasUsed,
       excessBlobGas: rpcBlock.excessBlobGas,
       withdrawalsRoot: rpcBlock.withdrawalsRoot,
@@ -51,21 +51,25 @@ export class AddressFetcher {
   ): Promise<TraceFilterResult[]> {
     const fromBlockParam = fromBlock === "earliest" ? "earliest" : `0x${fromBlock.toString(16)}`;
     const toBlockParam = toBlock === "latest" ? "latest" : `0x${toBlock.toString(16)}`;
-
-    const fromTraces = await this.rpcClient.call<TraceFilterResult[]>("trace_filter", [
-      {
-        fromBlock: fromBlockParam,
-        toBlock: toBlockParam,
-        fromAddress: [address],
-      },
-    ]);
-
-    const toTraces = await this.rpcClient.call<TraceFilterResult[]>("trace_filter", [
-      {
-        fromBlock: fromBlockParam,
-        toBlock: toBlockParam,
-        toAddress: [address],
-      },
+    // Nodes compare filter addresses case-insensitively, but send one canonical form
+    const normalizedAddress = address.toLowerCase();
+
+    // Sender and receiver traces are independent, request them concurrently
+    const [fromTraces, toTraces] = await Promise.all([
+      this.rpcClient.call<TraceFilterResult[]>("trace_filter", [
+        {
+          fromBlock: fromBlockParam,
+          toBlock: toBlockParam,
+          fromAddress: [normalizedAddress],
+        },
+      ]),
+      this.rpcClient.call<TraceFilterResult[]>("trace_filter", [
+        {
+          fromBlock: fromBlockParam,
+          toBlock: toBlockParam,
+          toAddress: [normalizedAddress],
+        },
+      ]),
     ]);
 
     return [...fromTraces, ...toTraces];
@@ -81,31 +85,33 @@ export class AddressFetcher {
   ): Promise<LogEntry[]> {
     const fromBlockParam = fromBlock === "earliest" ? "earliest" : `0x${fromBlock.toString(16)}`;
     const toBlockParam = toBlock === "latest" ? "latest" : `0x${toBlock.toString(16)}`;
-    const paddedAddress = `0x${address.toLowerCase().slice(2).padStart(64, "0")}`;
-
-    // Get logs emitted BY this address (for contracts)
-    const logsFromContract = await this.rpcClient.call<LogEntry[]>("eth_getLogs", [
-      {
-        fromBlock: fromBlockParam,
-        toBlock: toBlockParam,
-        address: address,
-      },
-    ]);
-
-    const logsAsTopic1 = await this.rpcClient.call<LogEntry[]>("eth_getLogs", [
-      {
-        fromBlock: fromBlockParam,
-        toBlock: toBlockParam,
-        topics: [null, paddedAddress],
-      },
-    ]);
-
-    const logsAsTopic2 = await this.rpcClient.call<LogEntry[]>("eth_getLogs", [
-      {
-        fromBlock: fromBlockParam,
-        toBlock: toBlockParam,
-        topics: [null, null, paddedAddress],
-      },
+    const normalizedAddress = address.toLowerCase();
+    const paddedAddress = `0x${normalizedAddress.slice(2).padStart(64, "0")}`;
+
+    // The three log queries are independent, request them concurrently
+    const [logsFromContract, logsAsTopic1, logsAsTopic2] = await Promise.all([
+      // Get logs emitted BY this address (for contracts)
+      this.rpcClient.call<LogEntry[]>("eth_getLogs", [
+        {
+          fromBlock: fromBlockParam,
+          toBlock: toBlockParam,
+          address: normalizedAddress,
+        },
+      ]),
+      this.rpcClient.call<LogEntry[]>("eth_getLogs", [
+        {
+          fromBlock: fromBlockParam,
+          toBlock: toBlockParam,
+          topics: [null, paddedAddress],
+        },
+      ]),
+      this.rpcClient.call<LogEntry[]>("eth_getLogs", [
+        {
+          fromBlock: fromBlockParam,
+          toBlock: toBlockParam,
+          topics: [null, null, paddedAddress],
+        },
+      ]),
     ]);
 
     // Combine all logs and deduplicate
@@ -10,7 +10,6 @@ export class BlockFetcher {
   ) {}
 
   async getBlock(blockNumber: number | "latest"): Promise<RPCBlock | null> {
-    console.log("Fetching Optimism block number:", blockNumber);
     const blockParam = blockNumber === "latest" ? "latest" : `0x${blockNumber.toString(16)}`;
 
     return await this.rpcClient.call<RPCBlock>("eth_getBlockByNumber", [
@@ -28,6 +27,49 @@ export class BlockFetcher {
     ]);
   }
 
+  /**
+   * Fetch several block headers in a single JSON-RPC batch request, or one request per
+   * block when the endpoint doesn't accept batches
+   */
+  async getBlocks(blockNumbers: number[]): Promise<Array<RPCBlock | null>> {
+    if (blockNumbers.length === 0) return [];
+
+    try {
+      return await this.rpcClient.batchCall<RPCBlock | null>(
+        blockNumbers.map((blockNumber) => ({
+          method: "eth_getBlockByNumber",
+          params: [`0x${blockNumber.toString(16)}`, false],
+        })),
+      );
+    } catch (error) {
+      // Some providers reject batch requests, fall back to one request per block
+      console.warn("Batch block request failed, fetching individually:", error);
+      return await Promise.all(blockNumbers.map((blockNumber) => this.getBlock(blockNumber)));
+    }
+  }
+
+  /**
+   * Fetch several blocks with full transaction objects using JSON-RPC batch requests,
+   * falling back to one request per block when the endpoint doesn't accept batches
+   */
+  async getBlocksWithTransactions(blockNumbers: number[]): Promise<Array<RPCBlock | null>> {
+    if (blockNumbers.length === 0) return [];
+
+    try {
+      return await this.rpcClient.batchCall<RPCBlock | null>(
+        blockNumbers.map((blockNumber) => ({
+          method: "eth_getBlockByNumber",
+          params: [`0x${blockNumber.toString(16)}`, true],
+        })),
+      );
+    } catch (error) {
+      console.warn("Batch block request failed, fetching individually:", error);
+      return await Promise.all(
+        blockNumbers.map((blockNumber) => this.getBlockWithTransactions(blockNumber)),
+      );
+    }
+  }
+
   async getLatestBlockNumber(): Promise<number> {
     const result = await this.rpcClient.call<string>("eth_blockNumber", []);
     return parseInt(result, 16);
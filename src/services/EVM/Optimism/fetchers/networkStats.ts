@@ -10,10 +10,34 @@ export class NetworkStatsFetcher {
   ) {}
 
   async getNetworkStats(): Promise<NetworkStats> {
-    const [gasPrice, syncing, blockNumber, clientVersion] = await Promise.all([
-      this.rpcClient.call<string>("eth_gasPrice", []),
-      this.rpcClient.call<boolean | object>("eth_syncing", []),
-      this.rpcClient.call<string>("eth_blockNumber", []),
+    // The required calls go out in one batch request, falling back to individual calls if
+    // the endpoint rejects batches. web3_clientVersion is optional and may be unsupported,
+    // so it is sent on its own where its failure can't take the batch down with it
+    const [[gasPrice, syncing, blockNumber], clientVersion] = await Promise.all([
+      this.rpcClient
+        .batchCall<string | boolean | object>([
+          { method: "eth_gasPrice", params: [] },
+          { method: "eth_syncing", params: [] },
+          { method: "eth_blockNumber", params: [] },
+        ])
+        .then(([gasPrice, syncing, blockNumber]) => {
+          if (
+            typeof gasPrice !== "string" ||
+            typeof blockNumber !== "string" ||
+            syncing === undefined ||
+            typeof syncing === "string"
+          ) {
+            throw new Error("Unexpected network stats batch response");
+          }
+          return [gasPrice, syncing, blockNumber] as const;
+        })
+        .catch(() =>
+          Promise.all([
+            this.rpcClient.call<string>("eth_gasPrice", []),
+            this.rpcClient.call<boolean | object>("eth_syncing", []),
+            this.rpcClient.call<string>("eth_blockNumber", []),
+          ]),
+        ),
       this.rpcClient.call<string>("web3_clientVersion", []).catch(() => "Unknown"),
     ]);
 
@@ -0,0 +1,105 @@
+import { afterEach, describe, expect, it, vi } from "vitest";
+import { RPCClient, type RPCRequest } from "./RPCClient";
+
+const RPC_URL = "https://rpc.test";
+
+/**
+ * Replace global fetch with a JSON-RPC endpoint that answers each request body with
+ * the given handler
+ */
+function mockFetch(respond: (requests: RPCRequest[]) => unknown) {
+  const fetchMock = vi.fn(async (_url: string, init?: RequestInit) => {
+    const requests: RPCRequest[] = JSON.parse(String(init?.body));
+    return {
+      ok: true,
+      status: 200,
+      statusText: "OK",
+      json: async () => respond(requests),
+    };
+  });
+  vi.stubGlobal("fetch", fetchMock);
+  return fetchMock;
+}
+
+describe("RPCClient", () => {
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  describe("batchCall", () => {
+    it("should match out-of-order responses to their requests by id", async () => {
+      mockFetch((requests) =>
+        requests
+          .map((request) => ({ jsonrpc: "2.0", id: request.id, result: request.params[0] }))
+          .reverse(),
+      );
+      const client = new RPCClient(RPC_URL);
+
+      const results = await client.batchCall<string>([
+        { method: "eth_getBlockByNumber", params: ["0x1"] },
+        { method: "eth_getBlockByNumber", params: ["0x2"] },
+        { method: "eth_getBlockByNumber", params: ["0x3"] },
+      ]);
+
+      expect(results).toEqual(["0x1", "0x2", "0x3"]);
+    });
+
+    it("should split calls above the batch size and keep results in order", async () => {
+      const fetchMock = mockFetch(async (requests) => {
+        // Later chunks answer first, so completion order differs from request order
+        const first = Number(requests[0]?.params[0]);
+        await new Promise((resolve) => setTimeout(resolve, 10 - first));
+        return requests.map((request) => ({
+          jsonrpc: "2.0",
+          id: request.id,
+          result: request.params[0],
+        }));
+      });
+      const client = new RPCClient({ rpcUrls: RPC_URL, batchSize: 3, maxConcurrentBatches: 2 });
+
+      const calls = Array.from({ length: 7 }, (_, i) => ({ method: "eth_call", params: [i] }));
+      const results = await client.batchCall<number>(calls);
+
+      expect(results).toEqual([0, 1, 2, 3, 4, 5, 6]);
+      expect(fetchMock).toHaveBeenCalledTimes(3);
+      const batchSizes = fetchMock.mock.calls.map(
+        ([, init]) => JSON.parse(String(init?.body)).length,
+      );
+      expect(batchSizes).toEqual([3, 3, 1]);
+    });
+
+    it("should reject when the endpoint answers a batch with a single error object", async () => {
+      mockFetch(() => ({
+        jsonrpc: "2.0",
+        id: null,
+        error: { code: -32600, message: "batch requests are not supported" },
+      }));
+      const client = new RPCClient(RPC_URL);
+
+      await expect(
+        client.batchCall([
+          { method: "eth_blockNumber", params: [] },
+          { method: "eth_gasPrice", params: [] },
+        ]),
+      ).rejects.toThrow("RPC batch request rejected: batch requests are not supported");
+    });
+
+    it("should reject when one of the calls in the batch fails", async () => {
+      mockFetch((requests) =>
+        requests.map((request, index) =>
+          index === 1
+            ? { jsonrpc: "2.0", id: request.id, error: { code: -32601, message: "not found" } }
+            : { jsonrpc: "2.0", id: request.id, result: "0x1" },
+        ),
+      );
+      const client = new RPCClient(RPC_URL);
+
+      await expect(
+        client.batchCall([
+          { method: "eth_blockNumber", params: [] },
+          { method: "web3_clientVersion", params: [] },
+        ]),
+      ).rejects.toThrow("RPC error: not found (code: -32601)");
+    });
+  });
+});
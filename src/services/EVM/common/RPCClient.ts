@@ -33,13 +33,23 @@ export type RPCStrategy = "fallback" | "parallel";
 export interface RPCClientConfig {
   rpcUrls: string | string[];
   strategy?: RPCStrategy;
+  // Maximum number of calls sent in one batch request, larger batches are split
+  batchSize?: number;
+  // Maximum number of split batch requests in flight at once
+  maxConcurrentBatches?: number;
 }
 
+// Public endpoints commonly cap batches somewhere between 10 and 100 calls
+const DEFAULT_BATCH_SIZE = 40;
+const DEFAULT_MAX_CONCURRENT_BATCHES = 4;
+
 export class RPCClient {
   private requestId = 0;
   private rpcUrls: string[];
   private currentUrlIndex = 0;
   private strategy: RPCStrategy = "fallback";
+  private batchSize = DEFAULT_BATCH_SIZE;
+  private maxConcurrentBatches = DEFAULT_MAX_CONCURRENT_BATCHES;
 
   constructor(config: string | string[] | RPCClientConfig) {
     // Support multiple constructor signatures for backwards compatibility
@@ -51,6 +61,8 @@ export class RPCClient {
       // New config object
       this.rpcUrls = Array.isArray(config.rpcUrls) ? config.rpcUrls : [config.rpcUrls];
       this.strategy = config.strategy || "fallback";
+      this.batchSize = config.batchSize || DEFAULT_BATCH_SIZE;
+      this.maxConcurrentBatches = config.maxConcurrentBatches || DEFAULT_MAX_CONCURRENT_BATCHES;
     }
 
     if (this.rpcUrls.length === 0) {
@@ -165,16 +177,6 @@ export class RPCClient {
   }
   // biome-ignore lint/suspicious/noExplicitAny: <TODO>
   async call<T = any>(method: string, params: any[] = []): Promise<T> {
-    console.log(
-      `RPCClient.call: ${method}`,
-      "params:",
-      params,
-      "strategy:",
-      this.strategy,
-      "using URLs:",
-      this.rpcUrls,
-    );
-
     // Use parallel strategy if configured
     if (this.strategy === "parallel") {
       const results = await this.parallelCall<T>(method, params);
@@ -222,9 +224,46 @@ export class RPCClient {
 
   /**
    * Batch multiple RPC calls with fallback support
+   * Calls beyond the configured batch size are split into several batches, sent concurrently
+   * up to the configured limit so large ranges don't trip provider rate limits
    */
   // biome-ignore lint/suspicious/noExplicitAny: <TODO>
   async batchCall<T = any>(calls: Array<{ method: string; params: any[] }>): Promise<T[]> {
+    if (calls.length <= this.batchSize) {
+      return this.sendBatch<T>(calls);
+    }
+
+    // biome-ignore lint/suspicious/noExplicitAny: <TODO>
+    const chunks: Array<Array<{ method: string; params: any[] }>> = [];
+    for (let i = 0; i < calls.length; i += this.batchSize) {
+      chunks.push(calls.slice(i, i + this.batchSize));
+    }
+
+    const chunkResults: T[][] = [];
+    let nextChunk = 0;
+    const sendChunks = async () => {
+      while (nextChunk < chunks.length) {
+        const index = nextChunk++;
+        const chunk = chunks[index];
+        if (chunk) chunkResults[index] = await this.sendBatch<T>(chunk);
+      }
+    };
+    await Promise.all(
+      Array.from({ length: Math.min(this.maxConcurrentBatches, chunks.length) }, sendChunks),
+    );
+
+    const results: T[] = [];
+    for (const chunkResult of chunkResults) {
+      results.push(...chunkResult);
+    }
+    return results;
+  }
+
+  /**
+   * Send a single batch request with fallback support
+   */
+  // biome-ignore lint/suspicious/noExplicitAny: <TODO>
+  private async sendBatch<T = any>(calls: Array<{ method: string; params: any[] }>): Promise<T[]> {
     const orderedIndices = [
       this.currentUrlIndex,
       ...Array.from({ length: this.rpcUrls.length }, (_, i) => i).filter(
@@ -261,9 +300,27 @@ export class RPCClient {
           throw new Error(`RPC batch request failed: ${response.status} ${response.statusText}`);
         }
 
-        const data: RPCResponse<T>[] = await response.json();
+        const data: RPCResponse<T>[] | RPCResponse<T> = await response.json();
+
+        // Endpoints that reject a batch (unsupported or over their size limit) answer
+        // with a single error object instead of an array
+        if (!Array.isArray(data)) {
+          throw new Error(
+            `RPC batch request rejected: ${data.error?.message ?? "unexpected response"}`,
+          );
+        }
 
-        const results = data.map((item) => {
+        // Batch responses are not guaranteed to be in request order, match them by id
+        const responsesById = new Map<number, RPCResponse<T>>();
+        for (const item of data) {
+          responsesById.set(item.id, item);
+        }
+
+        const results = requests.map((request) => {
+          const item = responsesById.get(request.id);
+          if (!item) {
+            throw new Error(`RPC batch response missing result for id ${request.id}`);
+          }
           if (item.error) {
             throw new Error(`RPC error: ${item.error.message} (code: ${item.error.code})`);
           }
@@ -302,14 +359,6 @@ export class RPCClient {
     // biome-ignore lint/suspicious/noExplicitAny: <TODO>
     params: any[] = [],
   ): Promise<ParallelRequestResult<T>[]> {
-    console.log(
-      `RPCClient.parallelCall: ${method}`,
-      "params:",
-      params,
-      "to all URLs:",
-      this.rpcUrls,
-    );
-
     // Create a promise for each URL
     const promises = this.rpcUrls.map((url) => this.makeRequest<T>(url, method, params));
 
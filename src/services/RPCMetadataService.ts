@@ -11,13 +11,20 @@ export class RPCMetadataService {
    * Convert parallel results to metadata structure
    */
   static createMetadata(results: ParallelRequestResult[], strategy: "parallel"): RPCMetadata {
+    // Hashes are only compared between providers, so skip serializing a lone response
+    const successCount = results.filter((result) => result.status === "fulfilled").length;
+    const shouldHash = successCount > 1;
+
     const responses: RPCProviderResponse[] = results.map((result) => ({
       url: result.url,
       status: result.status === "fulfilled" ? "success" : "error",
       responseTime: 0, // TODO: Add timing in future
       data: result.response,
       error: result.error?.message,
-      hash: RPCMetadataService.hashData(result.response),
+      hash:
+        shouldHash && result.status === "fulfilled"
+          ? RPCMetadataService.hashData(result.response)
+          : undefined,
     }));
 
     const hasInconsistencies = RPCMetadataService.detectInconsistencies(responses);
@@ -36,17 +36,67 @@ async function rpcCall<T>(rpcUrl: string, method: string, params: unknown[]): Pr
   return data.result;
 }
 
+/**
+ * Make several RPC calls in a single JSON-RPC batch request
+ * Results are returned in the same order as the calls
+ */
+async function rpcBatchCall<T>(
+  rpcUrl: string,
+  calls: Array<{ method: string; params: unknown[] }>,
+): Promise<T[]> {
+  const response = await fetch(rpcUrl, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(
+      calls.map((call, index) => ({
+        jsonrpc: "2.0",
+        method: call.method,
+        params: call.params,
+        id: index,
+      })),
+    ),
+  });
+
+  const data = await response.json();
+
+  if (!Array.isArray(data)) {
+    throw new Error(data?.error?.message || "RPC batch requests not supported");
+  }
+
+  return calls.map((_, index) => {
+    const item = data.find((entry: { id: number }) => entry.id === index);
+    if (!item) {
+      throw new Error(`RPC batch response missing result for id ${index}`);
+    }
+    if (item.error) {
+      throw new Error(item.error.message);
+    }
+    return item.result as T;
+  });
+}
+
 /**
  * Fetch basic address data (balance, code, txCount)
  */
 async function fetchAddressData(addressHash: string, rpcUrl: string): Promise<Address> {
   const normalizedAddress = addressHash.toLowerCase();
+  const calls = [
+    { method: "eth_getBalance", params: [normalizedAddress, "latest"] },
+    { method: "eth_getCode", params: [normalizedAddress, "latest"] },
+    { method: "eth_getTransactionCount", params: [normalizedAddress, "latest"] },
+  ];
 
-  const [balance, code, txCount] = await Promise.all([
-    rpcCall<string>(rpcUrl, "eth_getBalance", [normalizedAddress, "latest"]),
-    rpcCall<string>(rpcUrl, "eth_getCode", [normalizedAddress, "latest"]),
-    rpcCall<string>(rpcUrl, "eth_getTransactionCount", [normalizedAddress, "latest"]),
-  ]);
+  // Fetch all three values in one round trip, falling back to separate calls
+  // for providers that do not accept batch requests
+  let results: string[];
+  try {
+    results = await rpcBatchCall<string>(rpcUrl, calls);
+  } catch {
+    results = await Promise.all(
+      calls.map((call) => rpcCall<string>(rpcUrl, call.method, call.params)),
+    );
+  }
+  const [balance = "0x0", code = "0x", txCount = "0x0"] = results;
 
   return {
     address: addressHash,
@@ -285,34 +285,37 @@ export async function fetchCollectionInfo(
     { selector: "0x18160ddd", key: "totalSupply" }, // totalSupply()
   ];
 
-  for (const call of calls) {
-    try {
-      const response = await fetch(rpcUrl, {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({
-          jsonrpc: "2.0",
-          method: "eth_call",
-          params: [{ to: contractAddress, data: call.selector }, "latest"],
-          id: 1,
-        }),
-      });
-      const data = await response.json();
-      if (!data.error && data.result && data.result !== "0x") {
-        if (call.key === "totalSupply") {
-          info.totalSupply = BigInt(data.result).toString();
-        } else {
-          const decoded = decodeAbiString(data.result);
-          if (decoded) {
-            if (call.key === "name") info.name = decoded;
-            if (call.key === "symbol") info.symbol = decoded;
+  // The calls are independent, send them concurrently instead of one round trip each
+  await Promise.all(
+    calls.map(async (call) => {
+      try {
+        const response = await fetch(rpcUrl, {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify({
+            jsonrpc: "2.0",
+            method: "eth_call",
+            params: [{ to: contractAddress, data: call.selector }, "latest"],
+            id: 1,
+          }),
+        });
+        const data = await response.json();
+        if (!data.error && data.result && data.result !== "0x") {
+          if (call.key === "totalSupply") {
+            info.totalSupply = BigInt(data.result).toString();
+          } else {
+            const decoded = decodeAbiString(data.result);
+            if (decoded) {
+              if (call.key === "name") info.name = decoded;
+              if (call.key === "symbol") info.symbol = decoded;
+            }
           }
         }
+      } catch {
+        // Continue on error
       }
-    } catch {
-      // Continue on error
-    }
-  }
+    }),
+  );
 
   return info;
 }
@@ -0,0 +1,24 @@
+import { describe, expect, it } from "vitest";
+import { formatWeiToEth } from "./formatUtils";
+
+describe("formatWeiToEth", () => {
+  it("should format whole and fractional ETH amounts with six decimals", () => {
+    expect(formatWeiToEth("0")).toBe("0.000000");
+    expect(formatWeiToEth("1000000000000000000")).toBe("1.000000");
+    expect(formatWeiToEth("1234567000000000000")).toBe("1.234567");
+  });
+
+  it("should round to the nearest sixth decimal", () => {
+    expect(formatWeiToEth("900000000000")).toBe("0.000001");
+    expect(formatWeiToEth("499999999999")).toBe("0.000000");
+    expect(formatWeiToEth("1999999999999999999")).toBe("2.000000");
+  });
+
+  it("should keep precision above 2^53 wei", () => {
+    expect(formatWeiToEth("123456789012345678901234567")).toBe("123456789.012346");
+  });
+
+  it("should accept hex amounts", () => {
+    expect(formatWeiToEth("0xde0b6b3a7640000")).toBe("1.000000");
+  });
+});
@@ -0,0 +1,19 @@
+/**
+ * Shared value formatting utilities for transaction lists.
+ */
+
+const WEI_PER_MICRO_ETH = BigInt("1000000000000");
+const HALF_MICRO_ETH = BigInt("500000000000");
+const MICRO_ETH_PER_ETH = BigInt("1000000");
+
+/**
+ * Format a wei amount as ETH with six decimals, rounded half up like Number.toFixed(6).
+ * Works on the exact integer, converting through Number loses precision above 2^53 wei
+ * @param wei - Non-negative wei amount, as a decimal or 0x-prefixed hex string
+ */
+export function formatWeiToEth(wei: string): string {
+  const microEth = (BigInt(wei) + HALF_MICRO_ETH) / WEI_PER_MICRO_ETH;
+  const whole = (microEth / MICRO_ETH_PER_ETH).toString();
+  const fraction = (microEth % MICRO_ETH_PER_ETH).toString();
+  return `${whole}.${"000000".slice(fraction.length)}${fraction}`;
+}
@@ -3,19 +3,23 @@
  * Used for decoding ABI-encoded strings from RPC responses.
  */
 
+const utf8Decoder = new TextDecoder("utf-8");
+
 /**
  * Convert a hex string to a UTF-8 string.
  * Stops at first null character (0x00).
  * Browser-compatible alternative to Node.js Buffer.from(hex, "hex").toString("utf8")
  */
 export function hexToString(hex: string): string {
-  let str = "";
-  for (let i = 0; i < hex.length; i += 2) {
-    const charCode = parseInt(hex.slice(i, i + 2), 16);
-    if (charCode === 0) break;
-    str += String.fromCharCode(charCode);
+  // Collect the bytes first and decode them in one call instead of growing a string per byte
+  const bytes = new Uint8Array(Math.floor(hex.length / 2));
+  let length = 0;
+  for (let i = 0; i + 1 < hex.length; i += 2) {
+    const byte = parseInt(hex.slice(i, i + 2), 16);
+    if (byte === 0) break;
+    bytes[length++] = byte;
   }
-  return str;
+  return utf8Decoder.decode(bytes.subarray(0, length));
 }
 
 /**